@@ -1 +1,2 @@
-from gym_wordle.envs.wordle_env import WordleEnv
\ No newline at end of file
+from gym_wordle.envs.wordle_env import WordleEnv
+from gym_wordle.envs.wordle_env import WordleVectorEnv
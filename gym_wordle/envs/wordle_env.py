@@ -1,8 +1,12 @@
+import functools
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.utils import seeding
 import numpy as np
+import os
 import pkg_resources
 import random
+import sys
 from typing import Optional
 import colorama
 from colorama import Fore
@@ -10,8 +14,21 @@ from colorama import Style
 
 from gym_wordle.exceptions import InvalidWordException
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the pure-Python loop
+    njit = None
+
 colorama.init(autoreset=True)
 
+# fully formatted "<color><letter> " cell strings used by render(), indexed
+# by status then letter; -1 is the unguessed (uncolored) alphabet row
+LETTERS = [chr(ord('a') + i) for i in range(26)]
+RENDER_CELLS = {-1: [letter + " " for letter in LETTERS]}
+for _status, _color in ((0, Fore.BLACK), (1, Fore.YELLOW), (2, Fore.GREEN)):
+    RENDER_CELLS[_status] = [_color + Style.BRIGHT + letter
+                             + Style.RESET_ALL + " " for letter in LETTERS]
+
 # global game variables
 GAME_LENGTH = 6
 WORD_LENGTH = 5
@@ -23,21 +40,136 @@ filename = pkg_resources.resource_filename(
 )
 
 def encodeToStr(encoding):
-    string = ""
-    for enc in encoding:
-        string += chr(ord('a') + enc)
-    return string
+    return (np.asarray(encoding, dtype=np.uint8) + 97).tobytes().decode('ascii')
 
 def strToEncode(lines):
-    encoding = []
-    for line in lines:
-        assert len(line.strip()) == 5  # Must contain 5-letter words for now
-        encoding.append(tuple(ord(char) - 97 for char in line.strip()))
-    return encoding
+    """Encode lines of words ('a' -> 0 ... 'z' -> 25) into an (N, 5) int8 array."""
+    data = ''.join(lines).encode('ascii')
+    if not data.endswith(b'\n'):
+        data += b'\n'
+    arr = np.frombuffer(data, dtype=np.uint8).reshape(-1, WORD_LENGTH + 1)
+    words = arr[:, :WORD_LENGTH]
+    # Must contain 5-letter lowercase words for now
+    assert (arr[:, WORD_LENGTH] == ord('\n')).all()
+    assert ((words >= ord('a')) & (words <= ord('z'))).all()
+    return words.astype(np.int8) - 97
+
+
+# the encoded word list is cached next to the text file as a .npy so that
+# importing the package memory-maps the saved array instead of re-parsing
+# ~13k lines of Python on every interpreter start
+try:
+    if os.path.getmtime(filename) > os.path.getmtime(filename + '.npy'):
+        raise OSError("word-list cache is older than the text file")
+    WORDS_ARR = np.load(filename + '.npy', mmap_mode='r')
+except (OSError, ValueError, EOFError):
+    # cache missing, stale, truncated or unreadable; fall back to the text file
+    with open(filename, "r") as f:
+        # unique(axis=0) sorts and dedups the rows in one pass
+        WORDS_ARR = np.unique(strToEncode(f.readlines()), axis=0)
+    try:
+        # write to a temp file and rename so concurrent importers never
+        # see (or get stuck with) a half-written cache
+        tmp = filename + '.npy.tmp.%d' % os.getpid()
+        with open(tmp, 'wb') as f:
+            np.save(f, WORDS_ARR)
+        os.replace(tmp, filename + '.npy')
+    except OSError:
+        pass  # read-only install; parse again on the next import
+
+# each word also gets packed into a single int (5 bits per letter, 25 bits
+# total) so step() can validate a guess with one int hash instead of
+# building and hashing a 5-element tuple
+PACK_WEIGHTS = np.array([1, 1 << 5, 1 << 10, 1 << 15, 1 << 20], dtype=np.int64)
+WORDS_PACKED_ARR = np.sort(WORDS_ARR @ PACK_WEIGHTS)
+WORDS_PACKED = frozenset(int(key) for key in WORDS_PACKED_ARR)
+
 
+def _build_trie(words):
+    """Build a fixed-width 26-ary trie over ``words``.
+
+    Returns a ``(num_nodes, 26)`` int32 matrix of child indices (-1 where
+    no child exists) and a boolean leaf mask. The matrix form keeps prefix
+    queries — e.g. enumerating words consistent with current feedback — to
+    simple array indexing for solvers built on top of the env.
+    """
+    children = [[-1] * 26]
+    is_leaf = [False]
+    for word in words:
+        node = 0
+        for char in word:
+            child = children[node][char]
+            if child == -1:
+                child = len(children)
+                children[node][char] = child
+                children.append([-1] * 26)
+                is_leaf.append(False)
+            node = child
+        is_leaf[node] = True
+    return np.array(children, dtype=np.int32), np.array(is_leaf, dtype=bool)
+
+
+@functools.lru_cache(maxsize=None)
+def get_trie():
+    """Return the (children, leaf-mask) trie arrays, built on first use.
+
+    Building takes a Python pass over the whole word list, so it is
+    deferred until a solver actually asks for it rather than taxing
+    every import.
+    """
+    return _build_trie(WORDS_ARR)
 
-with open(filename, "r") as f:
-    WORDS = strToEncode(f.readlines())
+
+def trie_match(word):
+    """Return True if ``word`` (a length-5 letter encoding) is in the word list."""
+    children, is_leaf = get_trie()
+    node = 0
+    for char in word:
+        node = children[node, char]
+        if node == -1:
+            return False
+    return bool(is_leaf[node])
+
+
+def _score(hidden, hidden_mask, guess, out):
+    """Fill ``out`` with the 0/1/2 (gray/yellow/green) feedback for a guess."""
+    for idx in range(WORD_LENGTH):
+        char = guess[idx]
+        if hidden[idx] == char:
+            out[idx] = 2
+        elif (hidden_mask >> char) & 1:
+            out[idx] = 1
+        else:
+            out[idx] = 0
+
+
+if njit is not None:
+    # JIT-compile the scoring loop; it runs on every env step, so in RL
+    # training the compiled kernel pays for itself almost immediately
+    _score = njit(cache=True)(_score)
+
+
+def _unpack(packed):
+    return np.array([(packed >> (5 * idx)) & 31 for idx in range(WORD_LENGTH)],
+                    dtype=np.int8)
+
+
+@functools.lru_cache(maxsize=1 << 20)
+def _score_cached(hidden_packed, guess_packed):
+    """Memoized scoring; feedback is a pure function of the two packed words.
+
+    With a fixed word list the same (hidden, guess) pairs recur constantly
+    across episodes, so the cache (shared by every env in the process) hits
+    far more often than the kernel runs.
+    """
+    hidden = _unpack(hidden_packed)
+    guess = _unpack(guess_packed)
+    hidden_mask = np.int64(0)
+    for char in hidden:
+        hidden_mask |= np.int64(1) << char
+    out = np.empty(WORD_LENGTH, dtype=np.int8)
+    _score(hidden, hidden_mask, guess, out)
+    return out.tobytes()
 
 
 class WordleEnv(gym.Env):
@@ -76,47 +208,61 @@ class WordleEnv(gym.Env):
             has been used in a guess. As the player guesses words, the letters in the
             alphabet will change to values in the range [0, 2] indicating whether the
             characters are missing in the hidden word, in the incorrect position,
-            or in the correct position.
+            or in the correct position. Each letter keeps the best status seen
+            across guesses, so a letter marked in the correct position stays
+            that way even if a later guess places it elsewhere.
     """
 
     def __init__(self):
         super(WordleEnv, self).__init__()
         self.action_space = spaces.MultiDiscrete([26] * WORD_LENGTH)
         self.observation_space = spaces.Dict({
-            'board': spaces.Box(low=-1, high=2, shape=(GAME_LENGTH, WORD_LENGTH), dtype=int),
-            'alphabet': spaces.Box(low=-1, high=2, shape=(26,), dtype=int)
+            'board': spaces.Box(low=-1, high=2, shape=(GAME_LENGTH, WORD_LENGTH), dtype=np.int8),
+            'alphabet': spaces.Box(low=-1, high=2, shape=(26,), dtype=np.int8)
         })
-        self.guesses = []
+        # allocated once; reset() just refills them in place. int8 is
+        # plenty for values in [-1, 2] and keeps observations small when
+        # they get stacked across vectorized envs
+        self.board = np.full((GAME_LENGTH, WORD_LENGTH), -1, dtype=np.int8)
+        self.alphabet = np.full((26,), -1, dtype=np.int8)
+        self.guesses = np.full((GAME_LENGTH, WORD_LENGTH), -1, dtype=np.int8)
+        # observations alias the live arrays, so the same dict can be
+        # handed back every step instead of allocating a new one
+        self._obs = {'board': self.board, 'alphabet': self.alphabet}
 
     def step(self, action):
-        assert self.action_space.contains(action)
+        # cheap range check; MultiDiscrete.contains is far too slow to run
+        # on every step. Validate before narrowing to int8 so out-of-range
+        # values can't wrap into [0, 26); an if/raise (not an assert) so the
+        # guard survives python -O
+        a = np.asarray(action)
+        if a.shape != (WORD_LENGTH,) or a.dtype.kind not in 'iu' \
+                or (a < 0).any() or (a >= 26).any():
+            raise ValueError("action must be %d integers in [0, 25]" % WORD_LENGTH)
+        a = a.astype(np.int8)
 
         # Action must be a valid word
-        if not tuple(action) in WORDS:
-            raise InvalidWordException(encodeToStr(action) + " is not a valid word.")
+        key = int(np.dot(a, PACK_WEIGHTS))
+        if key not in WORDS_PACKED:
+            raise InvalidWordException(encodeToStr(a) + " is not a valid word.")
 
         # update game board and alphabet tracking
         board_row_idx = GAME_LENGTH - self.guesses_left
-        for idx, char in enumerate(action):
-
-            if self.hidden_word[idx] == char:
-                encoding = 2
-            elif char in self.hidden_word:
-                encoding = 1
-            else:
-                encoding = 0
-
-            self.board[board_row_idx, idx] = encoding
-            self.alphabet[char] = encoding
+        self.board[board_row_idx] = np.frombuffer(
+            _score_cached(self.hidden_packed, key), dtype=np.int8)
+        # keep the best-known status per letter; a letter scored green in an
+        # earlier guess must not be demoted by a later gray/yellow
+        np.maximum.at(self.alphabet, a, self.board[board_row_idx])
 
         # update guesses remaining tracker
         self.guesses_left -= 1
 
         # update previous guesses made
-        self.guesses.append(action)
+        self.guesses[board_row_idx] = a
 
-        # check to see if game is over
-        if all(self.board[board_row_idx, :] == 2):
+        # check to see if game is over; the packed guess matches the packed
+        # hidden word exactly when every cell scored green
+        if key == self.hidden_packed:
             reward = 1.0
             done = True
         else:
@@ -130,43 +276,138 @@ class WordleEnv(gym.Env):
         return self._get_obs(), reward, done, {}
 
     def _get_obs(self):
-        return {'board': self.board, 'alphabet': self.alphabet}
+        return self._obs
 
     def reset(self, seed: Optional[int] = None):
         # super().reset(seed=seed)
-        self.hidden_word = random.choice(WORDS)
+        self.hidden_word = np.asarray(random.choice(WORDS_ARR), dtype=np.int8)
+        self.hidden_packed = int(np.dot(self.hidden_word, PACK_WEIGHTS))
         self.guesses_left = GAME_LENGTH
-        self.board = np.negative(
-            np.ones(shape=(GAME_LENGTH, WORD_LENGTH), dtype=int))
-        self.alphabet = np.negative(np.ones(shape=(26,), dtype=int))
-        self.guesses = []
+        self.board.fill(-1)
+        self.alphabet.fill(-1)
+        self.guesses.fill(-1)
         return self._get_obs()
 
     def render(self, mode="human"):
         assert mode in ["human"], "Invalid mode, must be \"human\""
-        print('###################################################')
-        for i in range(len(self.guesses)):
+        # build the whole frame first and emit it with a single write();
+        # one flush per frame instead of one per cell
+        parts = ['###################################################\n']
+        for i in range(GAME_LENGTH - self.guesses_left):
             for j in range(WORD_LENGTH):
-                letter = chr(ord('a') + self.guesses[i][j])
-                if self.board[i][j] == 0:
-                    print(Fore.BLACK + Style.BRIGHT + letter + " ", end='')
-                elif self.board[i][j] == 1:
-                    print(Fore.YELLOW + Style.BRIGHT + letter + " ", end='')
-                elif self.board[i][j] == 2:
-                    print(Fore.GREEN + Style.BRIGHT + letter + " ", end='')
-            print()
-        print()
+                parts.append(
+                    RENDER_CELLS[int(self.board[i][j])][self.guesses[i][j]])
+            parts.append('\n')
+        parts.append('\n')
 
         for i in range(len(self.alphabet)):
-            letter = chr(ord('a') + i)
-            if self.alphabet[i] == 0:
-                print(Fore.BLACK + Style.BRIGHT + letter + " ", end='')
-            elif self.alphabet[i] == 1:
-                print(Fore.YELLOW + Style.BRIGHT + letter + " ", end='')
-            elif self.alphabet[i] == 2:
-                print(Fore.GREEN + Style.BRIGHT + letter + " ", end='')
-            elif self.alphabet[i] == -1:
-                print(letter + " ", end='')
-        print()
-        print('###################################################')
-        print()
+            parts.append(RENDER_CELLS[int(self.alphabet[i])][i])
+        parts.append('\n###################################################\n\n')
+        sys.stdout.write(''.join(parts))
+
+
+class WordleVectorEnv(gym.vector.VectorEnv):
+    """
+    Vectorized Wordle Environment
+
+    Runs ``num_envs`` games in lockstep and scores every guess with one
+    batched NumPy broadcast instead of ``num_envs`` Python-level step()
+    calls. Observations are the batched counterparts of WordleEnv's:
+    ``board`` is (num_envs, 6, 5) and ``alphabet`` is (num_envs, 26).
+
+    Following the gymnasium vector-env convention, a sub-environment whose
+    game ends is reset automatically: its returned observation is the fresh
+    board of the next game and its terminal observation — e.g. the all-green
+    winning row — is delivered in ``infos["final_observation"]``. Actions
+    must all be valid words; any invalid guess raises InvalidWordException,
+    as in WordleEnv.
+    """
+
+    def __init__(self, num_envs):
+        super(WordleVectorEnv, self).__init__(
+            num_envs,
+            spaces.Dict({
+                'board': spaces.Box(low=-1, high=2, shape=(GAME_LENGTH, WORD_LENGTH), dtype=np.int8),
+                'alphabet': spaces.Box(low=-1, high=2, shape=(26,), dtype=np.int8)
+            }),
+            spaces.MultiDiscrete([26] * WORD_LENGTH),
+        )
+        self.hidden_words = np.zeros((num_envs, WORD_LENGTH), dtype=np.int8)
+        self.hidden_packed = np.zeros(num_envs, dtype=np.int64)
+        self.hidden_masks = np.zeros(num_envs, dtype=np.int64)
+        self.boards = np.full((num_envs, GAME_LENGTH, WORD_LENGTH), -1, dtype=np.int8)
+        self.alphabets = np.full((num_envs, 26), -1, dtype=np.int8)
+        self.board_row_idxs = np.zeros(num_envs, dtype=np.int64)
+        self._obs = {'board': self.boards, 'alphabet': self.alphabets}
+
+    def _reset_games(self, env_idxs):
+        picks = self.np_random.integers(len(WORDS_ARR), size=len(env_idxs))
+        self.hidden_words[env_idxs] = WORDS_ARR[picks]
+        self.hidden_packed[env_idxs] = self.hidden_words[env_idxs] @ PACK_WEIGHTS
+        self.hidden_masks[env_idxs] = np.bitwise_or.reduce(
+            np.int64(1) << self.hidden_words[env_idxs].astype(np.int64), axis=1)
+        self.boards[env_idxs] = -1
+        self.alphabets[env_idxs] = -1
+        self.board_row_idxs[env_idxs] = 0
+
+    def _get_obs(self):
+        return self._obs
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        # seed only this instance's generator, never the global NumPy RNG
+        if seed is not None:
+            self._np_random, _ = seeding.np_random(seed)
+        self._reset_games(np.arange(self.num_envs))
+        return self._get_obs(), {}
+
+    def step(self, actions):
+        # validate before narrowing to int8, as in WordleEnv.step, so
+        # out-of-range values can't wrap into [0, 26); if/raise so the
+        # guard survives python -O
+        a = np.asarray(actions)
+        if a.shape != (self.num_envs, WORD_LENGTH) or a.dtype.kind not in 'iu' \
+                or (a < 0).any() or (a >= 26).any():
+            raise ValueError("actions must be (%d, %d) integers in [0, 25]"
+                             % (self.num_envs, WORD_LENGTH))
+        a = a.astype(np.int8)
+
+        # every action must be a valid word
+        keys = a @ PACK_WEIGHTS
+        valid = np.isin(keys, WORDS_PACKED_ARR)
+        if not valid.all():
+            bad = a[np.argmin(valid)]
+            raise InvalidWordException(encodeToStr(bad) + " is not a valid word.")
+
+        # score all games with one broadcast
+        green = self.hidden_words == a
+        present = ((self.hidden_masks[:, None] >> a) & 1).astype(bool)
+        encoding = np.where(green, 2, np.where(present, 1, 0)).astype(np.int8)
+
+        env_idxs = np.arange(self.num_envs)
+        self.boards[env_idxs, self.board_row_idxs] = encoding
+        # flat per-(env, letter) update, keeping the best-known status per
+        # letter as in WordleEnv; maximum.at is unbuffered, so duplicate
+        # letters within one guess resolve to their best score too
+        np.maximum.at(self.alphabets.reshape(-1),
+                      (env_idxs[:, None] * 26 + a).ravel(), encoding.ravel())
+        self.board_row_idxs += 1
+
+        wins = keys == self.hidden_packed
+        terminations = wins | (self.board_row_idxs >= GAME_LENGTH)
+        rewards = np.where(wins, 1.0, np.where(terminations, -1.0, 0.0))
+        truncations = np.zeros(self.num_envs, dtype=bool)
+
+        infos = {}
+        done_idxs = np.flatnonzero(terminations)
+        if len(done_idxs):
+            # stash terminal observations before the in-place reset wipes
+            # them, using the same info keys as gymnasium's SyncVectorEnv
+            final_obs = np.full(self.num_envs, None, dtype=object)
+            for idx in done_idxs:
+                final_obs[idx] = {'board': self.boards[idx].copy(),
+                                  'alphabet': self.alphabets[idx].copy()}
+            infos['final_observation'] = final_obs
+            infos['_final_observation'] = terminations.copy()
+            self._reset_games(done_idxs)
+
+        return self._get_obs(), rewards, terminations, truncations, infos
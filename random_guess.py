@@ -1,21 +1,20 @@
 import gymnasium as gym
+import numpy as np
 import gym_wordle
-from gym_wordle.exceptions import InvalidWordException
+from gym_wordle.envs.wordle_env import WORDS_ARR
 
 env = gym.make('Wordle-v0')
 
+rng = np.random.default_rng()
+
 obs = env.reset()
 done = False
 while not done:
-    while True:
-        try:
-            # make a random guess
-            act = env.action_space.sample()
+    # guess a random valid word; sampling straight from the word list
+    # skips the ~99.9% InvalidWordException rejection loop entirely
+    act = WORDS_ARR[rng.integers(len(WORDS_ARR))]
 
-            # take a step
-            obs, reward, done, _ = env.step(act)
-            break
-        except InvalidWordException:
-            pass
+    # take a step
+    obs, reward, done, _ = env.step(act)
 
-    env.render()
\ No newline at end of file
+    env.render()